@@ -0,0 +1,42 @@
+"""
+Gunicorn configuration for the legacy FastAPI server (server.old.py)
+
+Usage:
+    gunicorn -c gunicorn_conf.py server_old:app
+
+The app is imported once in the master (preload_app) and workers are
+forked from it, so they share the imported modules copy-on-write instead
+of each re-importing FastAPI, Pydantic and SlowAPI.
+"""
+
+import multiprocessing
+import os
+
+# Binding
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8001')}"
+backlog = int(os.getenv("BACKLOG", 2048))
+
+# Workers. slowapi keeps rate-limit counters per process unless
+# RATE_LIMIT_STORAGE_URI points at a shared backend (e.g. redis://), so only
+# fan out to 2*CPU+1 workers by default when the counters are shared
+if os.getenv("RATE_LIMIT_STORAGE_URI", "memory://").startswith("memory://"):
+    _default_workers = 1
+else:
+    _default_workers = 2 * multiprocessing.cpu_count() + 1
+workers = int(os.getenv("WORKERS", _default_workers))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# Timeouts
+timeout = int(os.getenv("TIMEOUT", 60))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("KEEPALIVE", 5))
+
+# Recycle workers periodically to cap memory growth
+max_requests = int(os.getenv("MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", 100))
+
+# Logging
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
@@ -2,11 +2,14 @@ from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Dict, Any
-import json
+import logging
+import orjson
 import os
 from tools.parse_le_to_mismo import parse_le_to_mismo
 from tools.parse_cd_to_mismo import parse_cd_to_mismo
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="MCP Mortgage Server",
     description="MCP server for parsing mortgage documents into MISMO format",
@@ -23,44 +26,66 @@ app.add_middleware(
 )
 
 # Load MCP config
-with open("mcp_config.json") as f:
-    MCP_CONFIG = json.load(f)
+with open("mcp_config.json", "rb") as f:
+    MCP_CONFIG = orjson.loads(f.read())
+
+# Index tools by name once so /call does a dict lookup instead of a list scan
+TOOLS_BY_NAME = {t["name"]: t for t in MCP_CONFIG["tools"]}
 
 class ToolRequest(BaseModel):
     tool: str
     input: Dict[str, Any]
 
+def _hello(input_data: dict[str, Any]) -> str:
+    name = input_data.get("name", "World")
+    return f"Hello, {name}!"
+
+# Tool name -> handler; each handler takes the request input and returns the output
+DISPATCH = {
+    "hello": _hello,
+    "parse_le_to_mismo_json": lambda d: parse_le_to_mismo(d),
+    "parse_cd_to_mismo_json": lambda d: parse_cd_to_mismo(d),
+}
+
 @app.get("/health")
-async def health_check():
+async def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 @app.get("/tools")
-async def list_tools():
+async def list_tools() -> dict[str, Any]:
     return {"tools": MCP_CONFIG["tools"]}
 
 @app.post("/call")
-async def call_tool(request: ToolRequest):
+async def call_tool(request: ToolRequest) -> dict[str, Any]:
     tool_name = request.tool
     input_data = request.input
 
     # Validate tool exists
-    tool_config = next((t for t in MCP_CONFIG["tools"] if t["name"] == tool_name), None)
-    if not tool_config:
+    if tool_name not in TOOLS_BY_NAME:
         raise HTTPException(status_code=404, detail=f"Tool {tool_name} not found")
 
+    handler = DISPATCH.get(tool_name)
+    if handler is None:
+        raise HTTPException(status_code=400, detail="Unknown tool")
+
     try:
-        if tool_name == "hello":
-            name = input_data.get("name", "World")
-            return {"output": f"Hello, {name}!"}
-        elif tool_name == "parse_le_to_mismo_json":
-            return {"output": parse_le_to_mismo(input_data)}
-        elif tool_name == "parse_cd_to_mismo_json":
-            return {"output": parse_cd_to_mismo(input_data)}
-        else:
-            raise HTTPException(status_code=400, detail="Unknown tool")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        return {"output": handler(input_data)}
+    except Exception:
+        # Exception text can carry paths, URLs or parser internals; log it only
+        logger.exception("Tool %s failed", tool_name)
+        raise HTTPException(status_code=500, detail="Internal Server Error") from None
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", 8000)))
+    # "auto" picks uvloop/httptools when installed (uvloop has no Windows
+    # build) and falls back to asyncio/h11; multiple workers need the app as an import string of a real module
+    # (main_old.py re-exports this app)
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
+    uvicorn.run(
+        app if workers == 1 else "main_old:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", 8000)),
+        loop="auto",
+        http="auto",
+        workers=workers
+    )
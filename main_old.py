@@ -0,0 +1,15 @@
+"""
+Importable alias for the legacy FastAPI app in main.old.py
+
+The dotted file name can't be imported as a module, so multi-worker Uvicorn
+uses ``main_old:app``.
+"""
+
+import importlib.util
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location("_main_old", Path(__file__).with_name("main.old.py"))
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+
+app = _module.app
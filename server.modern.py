@@ -33,14 +33,29 @@ Copyright (c) 2025 Confer Solutions
 License: MIT
 """
 
+from async_lru import alru_cache
 from fastmcp import FastMCP
-from pydantic import BaseModel, HttpUrl, Field, validator
-from typing import Optional, Literal, Dict, Any
+from pydantic import BaseModel, ConfigDict, HttpUrl, Field, computed_field, model_validator
+from typing import Any, ClassVar, Dict, Literal, Optional
+import asyncio
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+import hashlib
 import httpx
-import json
+import logging
+from operator import attrgetter
+import orjson
 from pathlib import Path
 from urllib.parse import urlparse
 import os
+import re
+from types import MappingProxyType
+
+try:
+    import numpy as np
+except ImportError:  # installed without the "batch" extra
+    np = None
 
 # ============================================================================
 # Configuration
@@ -49,23 +64,64 @@ import os
 __version__ = "2.0.0"
 __author__ = "Confer Solutions"
 
+logger = logging.getLogger(__name__)
+
 # Security: Allowed PDF source domains (prevent SSRF)
-ALLOWED_DOMAINS = os.getenv(
-    "ALLOWED_DOMAINS",
-    "storage.googleapis.com,s3.amazonaws.com,mortgage-docs.confer.ai"
-).split(",")
+# Normalized once at import; frozenset gives O(1) membership checks
+ALLOWED_DOMAINS = frozenset(
+    d.strip().lower()
+    for d in os.getenv(
+        "ALLOWED_DOMAINS",
+        "storage.googleapis.com,s3.amazonaws.com,mortgage-docs.confer.ai"
+    ).split(",")
+    if d.strip()
+)
+_PDF_SUFFIX = ".pdf"
+# https://<host>[:port]/<path>.pdf, optionally followed by a query or fragment
+# (";" is excluded from the path because urlparse splits it off as params)
+_URL_RE = re.compile(
+    r"\Ahttps://([a-z0-9][a-z0-9.\-]*(?::\d+)?)(/[^?#;\s]+\.pdf)(?:[?#]|\Z)", re.I
+)
 
 MAX_PDF_SIZE = int(os.getenv("MAX_PDF_SIZE", 10 * 1024 * 1024))  # 10MB
 DOWNLOAD_TIMEOUT = int(os.getenv("DOWNLOAD_TIMEOUT", 30))  # seconds
 
+# Caching: agents often retry the same document, so skip re-download/re-parse.
+# Downloads hold raw bytes, so the worst case is PDF_CACHE_SIZE * MAX_PDF_SIZE
+# per process (80MB by default); parsed models are small and cached separately
+PDF_CACHE_TTL = int(os.getenv("PDF_CACHE_TTL", 600))  # seconds
+PDF_CACHE_SIZE = int(os.getenv("PDF_CACHE_SIZE", 8))  # downloaded PDFs
+PARSE_CACHE_SIZE = int(os.getenv("PARSE_CACHE_SIZE", 256))  # parsed models
+
 # ============================================================================
 # Initialize MCP Server
 # ============================================================================
 
+# Shared HTTP client: keeps TCP/TLS connections to the storage domains alive
+# across downloads instead of handshaking on every tool call
+_HTTP = httpx.AsyncClient(
+    http2=True,
+    timeout=DOWNLOAD_TIMEOUT,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Close the shared HTTP client and parse pool when the server shuts down"""
+    try:
+        yield
+    finally:
+        await _HTTP.aclose()
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+
+
 mcp = FastMCP(
     name="Mortgage Document Parser",
     version=__version__,
-    description="Parse and analyze mortgage documents (Loan Estimates, Closing Disclosures) using MISMO standards"
+    description="Parse and analyze mortgage documents (Loan Estimates, Closing Disclosures) using MISMO standards",
+    lifespan=lifespan,
 )
 
 # ============================================================================
@@ -75,10 +131,20 @@ mcp = FastMCP(
 class MISMOLoanEstimate(BaseModel):
     """MISMO-compliant Loan Estimate data structure"""
 
+    # Immutable once validated, so derived values can be cached safely
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    # TRID tolerance bucket for each fee field (fees not listed have unlimited tolerance)
+    TOLERANCE_BUCKETS: ClassVar[Mapping[str, str]] = MappingProxyType({
+        "origination_charges": "zero",
+        "services_borrower_cannot_shop": "zero",
+        "services_borrower_can_shop": "10_percent",
+    })
+
     # Loan Information
     loan_amount: float = Field(
         ...,
-        gt=0,
+        ge=1000,  # Sanity check: reject unrealistic loan amounts
         lt=100_000_000,
         description="Total loan amount in USD"
     )
@@ -121,15 +187,10 @@ class MISMOLoanEstimate(BaseModel):
         description="Maps fees to tolerance buckets: zero, 10_percent, unlimited"
     )
 
-    @validator('loan_amount')
-    def validate_reasonable_loan(cls, v):
-        """Sanity check: reject unrealistic loan amounts"""
-        if v < 1000:
-            raise ValueError("Loan amount too small (< $1,000)")
-        if v > 50_000_000:
+    def model_post_init(self, __context: Any) -> None:
+        if self.loan_amount > 50_000_000:
             # Large loans allowed but flagged
-            print(f"WARNING: Large loan amount: ${v:,.2f}")
-        return v
+            logger.warning("Large loan amount: $%s", f"{self.loan_amount:,.2f}")
 
     @property
     def total_closing_costs(self) -> float:
@@ -148,6 +209,8 @@ class MISMOLoanEstimate(BaseModel):
 class MISMOClosingDisclosure(BaseModel):
     """MISMO-compliant Closing Disclosure data structure"""
 
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     # Similar structure to LE but with final amounts
     loan_amount: float = Field(..., gt=0)
     interest_rate: float = Field(..., ge=0, le=100)
@@ -171,6 +234,8 @@ class MISMOClosingDisclosure(BaseModel):
 class ComplianceReport(BaseModel):
     """TRID compliance comparison report"""
 
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     is_compliant: bool
     violations: list[Dict[str, Any]] = Field(default_factory=list)
     warnings: list[str] = Field(default_factory=list)
@@ -179,8 +244,32 @@ class ComplianceReport(BaseModel):
     zero_tolerance_diff: float = 0.0
     ten_percent_diff: float = 0.0
     ten_percent_limit: float = 0.0
+    apr_diff: float = 0.0
 
-    summary: str = ""
+    @model_validator(mode="before")
+    @classmethod
+    def _drop_summary(cls, data: Any) -> Any:
+        """Accept dumped reports: summary is derived, so ignore it on input"""
+        if isinstance(data, dict) and "summary" in data:
+            data = {k: v for k, v in data.items() if k != "summary"}
+        return data
+
+    @computed_field
+    @property
+    def summary(self) -> str:
+        """Plain-language summary, built on access and still serialized"""
+        if self.is_compliant:
+            return (
+                f"✓ COMPLIANT: Closing Disclosure is within TRID tolerance limits. "
+                f"Zero-tolerance items: no increase. "
+                f"10% tolerance items: ${self.ten_percent_diff:.2f} increase "
+                f"(limit: ${self.ten_percent_limit:.2f}). "
+                f"APR change: {self.apr_diff:.3f}% (limit: 0.125%)."
+            )
+        return (
+            f"✗ NOT COMPLIANT: {len(self.violations)} violation(s) found. "
+            f"Review required before closing."
+        )
 
 
 # ============================================================================
@@ -205,6 +294,12 @@ def validate_pdf_url(url: str) -> bool:
     Raises:
         ValueError: If URL fails validation
     """
+    # Fast path: one regex match plus one set lookup for well-formed URLs
+    match = _URL_RE.match(url)
+    if match and match.group(1).lower() in ALLOWED_DOMAINS:
+        return True
+
+    # Slow path: the original urlparse checks, which also name the failing rule
     parsed = urlparse(url)
 
     # Must be HTTPS
@@ -212,23 +307,26 @@ def validate_pdf_url(url: str) -> bool:
         raise ValueError(f"Only HTTPS URLs allowed, got: {parsed.scheme}")
 
     # Must be whitelisted domain
-    if parsed.netloc not in ALLOWED_DOMAINS:
+    if parsed.netloc.lower() not in ALLOWED_DOMAINS:
         raise ValueError(
             f"Domain not allowed: {parsed.netloc}. "
-            f"Allowed: {', '.join(ALLOWED_DOMAINS)}"
+            f"Allowed: {', '.join(sorted(ALLOWED_DOMAINS))}"
         )
 
     # Must be PDF file
-    if not parsed.path.lower().endswith('.pdf'):
+    if not parsed.path.lower().endswith(_PDF_SUFFIX):
         raise ValueError("Only PDF files allowed")
 
     return True
 
 
+@alru_cache(maxsize=PDF_CACHE_SIZE, ttl=PDF_CACHE_TTL)
 async def download_pdf(url: str) -> bytes:
     """
     Safely download PDF with size and timeout limits.
 
+    Successful downloads are cached per URL for PDF_CACHE_TTL seconds.
+
     Args:
         url: HTTPS URL to PDF (must pass validation)
 
@@ -242,33 +340,127 @@ async def download_pdf(url: str) -> bytes:
     """
     validate_pdf_url(url)
 
-    async with httpx.AsyncClient(timeout=DOWNLOAD_TIMEOUT) as client:
-        response = await client.get(url, follow_redirects=True)
+    # Stream the body so oversized responses are aborted as soon as they
+    # cross the limit instead of being fully buffered first
+    async with _HTTP.stream("GET", url, follow_redirects=True) as response:
         response.raise_for_status()
 
-        # Check size
-        content = response.content
-        if len(content) > MAX_PDF_SIZE:
-            raise ValueError(
-                f"PDF too large: {len(content)} bytes "
-                f"(max: {MAX_PDF_SIZE} bytes)"
-            )
+        buf = bytearray()
+        magic_checked = False
+        async for chunk in response.aiter_bytes(65536):
+            buf.extend(chunk)
 
-        # Basic PDF validation (magic bytes)
-        if not content.startswith(b'%PDF'):
-            raise ValueError("File does not appear to be a valid PDF")
+            # Check size
+            if len(buf) > MAX_PDF_SIZE:
+                raise ValueError(f"PDF too large: exceeds {MAX_PDF_SIZE} bytes")
 
-        return content
+            # Basic PDF validation (magic bytes), before reading the rest
+            if not magic_checked and len(buf) >= 4:
+                if not buf.startswith(b'%PDF'):
+                    raise ValueError("File does not appear to be a valid PDF")
+                magic_checked = True
+
+    if not magic_checked:
+        raise ValueError("File does not appear to be a valid PDF")
+
+    return bytes(buf)
 
 
 # ============================================================================
 # PDF Parsing (Stub - TODO: Implement)
 # ============================================================================
 
+# Validated models keyed by sha256 of the PDF bytes
+_LE_CACHE: dict[bytes, MISMOLoanEstimate] = {}
+_CD_CACHE: dict[bytes, MISMOClosingDisclosure] = {}
+
+
+def _cache_put(cache: dict[bytes, Any], key: bytes, value: Any) -> None:
+    """Insert into a bounded cache, evicting the oldest entry when full"""
+    if len(cache) >= PARSE_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+
+def clear_caches() -> None:
+    """Drop cached downloads and parsed models (between tests, or after a parser change)"""
+    download_pdf.cache_clear()
+    _LE_CACHE.clear()
+    _CD_CACHE.clear()
+
+
+def _build_le(data: dict[str, Any]) -> MISMOLoanEstimate:
+    """
+    Build a Loan Estimate from trusted parser output without re-validating.
+
+    Only for dicts produced by parse_le_pdf_content, which is responsible for
+    returning values that satisfy the model constraints. Use
+    MISMOLoanEstimate(**data) for anything coming from outside.
+    """
+    return MISMOLoanEstimate.model_construct(**data)
+
+
+def _build_cd(data: dict[str, Any]) -> MISMOClosingDisclosure:
+    """Closing Disclosure counterpart of _build_le (trusted parser output only)"""
+    return MISMOClosingDisclosure.model_construct(**data)
+
+
+# PDF parsing is CPU-bound, so it runs in a process pool to keep the event
+# loop free; the semaphore caps how many PDFs are queued on the pool at once
+MAX_CONCURRENT_PARSES = int(os.getenv("MAX_CONCURRENT_PARSES", os.cpu_count() or 1))
+_POOL: ProcessPoolExecutor | None = None
+_PARSE_SEM = asyncio.Semaphore(MAX_CONCURRENT_PARSES)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Create the parse pool on first use so importing the module stays cheap"""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
+
+
+async def _run_parser(func: Callable[[bytes], dict[str, Any]], pdf_bytes: bytes) -> dict[str, Any]:
+    """Run a synchronous parser in the process pool"""
+    async with _PARSE_SEM:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_pool(), func, pdf_bytes)
+
+
 async def parse_le_pdf_content(pdf_bytes: bytes) -> Dict[str, Any]:
     """
     Parse Loan Estimate PDF content.
 
+    Runs _sync_parse_le in the parse process pool.
+
+    Args:
+        pdf_bytes: PDF file content
+
+    Returns:
+        Extracted data as dict matching MISMOLoanEstimate
+    """
+    return await _run_parser(_sync_parse_le, pdf_bytes)
+
+
+async def parse_cd_pdf_content(pdf_bytes: bytes) -> dict[str, Any]:
+    """
+    Parse Closing Disclosure PDF content.
+
+    Runs _sync_parse_cd in the parse process pool.
+
+    Args:
+        pdf_bytes: PDF file content
+
+    Returns:
+        Extracted data as dict matching MISMOClosingDisclosure
+    """
+    return await _run_parser(_sync_parse_cd, pdf_bytes)
+
+
+def _sync_parse_le(pdf_bytes: bytes) -> dict[str, Any]:
+    """
+    Parse Loan Estimate PDF content (runs in a worker process).
+
     TODO: Implement actual PDF parsing logic.
 
     Options:
@@ -306,9 +498,9 @@ async def parse_le_pdf_content(pdf_bytes: bytes) -> Dict[str, Any]:
     }
 
 
-async def parse_cd_pdf_content(pdf_bytes: bytes) -> Dict[str, Any]:
+def _sync_parse_cd(pdf_bytes: bytes) -> dict[str, Any]:
     """
-    Parse Closing Disclosure PDF content.
+    Parse Closing Disclosure PDF content (runs in a worker process).
 
     TODO: Implement actual PDF parsing logic.
 
@@ -340,7 +532,6 @@ async def parse_cd_pdf_content(pdf_bytes: bytes) -> Dict[str, Any]:
 # MCP Tools
 # ============================================================================
 
-@mcp.tool()
 async def parse_loan_estimate(pdf_url: str) -> MISMOLoanEstimate:
     """
     Parse a Loan Estimate PDF into MISMO-compliant structured data.
@@ -386,14 +577,20 @@ async def parse_loan_estimate(pdf_url: str) -> MISMOLoanEstimate:
     # Download and validate PDF
     pdf_content = await download_pdf(pdf_url)
 
-    # Parse PDF content
-    data = await parse_le_pdf_content(pdf_content)
+    # Same bytes -> same validated model; skip parsing and validation
+    key = hashlib.sha256(pdf_content).digest()
+    le = _LE_CACHE.get(key)
+    if le is None:
+        # Parse PDF content
+        data = await parse_le_pdf_content(pdf_content)
 
-    # Validate and return structured data
-    return MISMOLoanEstimate(**data)
+        # Parser output is trusted, so skip re-validation
+        le = _build_le(data)
+        _cache_put(_LE_CACHE, key, le)
+
+    return le
 
 
-@mcp.tool()
 async def parse_closing_disclosure(pdf_url: str) -> MISMOClosingDisclosure:
     """
     Parse a Closing Disclosure PDF into MISMO-compliant structured data.
@@ -411,14 +608,36 @@ async def parse_closing_disclosure(pdf_url: str) -> MISMOClosingDisclosure:
     See parse_loan_estimate for security details.
     """
     pdf_content = await download_pdf(pdf_url)
-    data = await parse_cd_pdf_content(pdf_content)
-    return MISMOClosingDisclosure(**data)
+
+    key = hashlib.sha256(pdf_content).digest()
+    cd = _CD_CACHE.get(key)
+    if cd is None:
+        data = await parse_cd_pdf_content(pdf_content)
+        cd = _build_cd(data)
+        _cache_put(_CD_CACHE, key, cd)
+
+    return cd
+
+
+# Violation description templates, bound once rather than built per row
+_ZERO_TPL = "{name} increased by ${diff:.2f} (zero tolerance - no increase allowed)".format
+_TEN_TPL = "10% tolerance exceeded by ${excess:.2f}".format
+_APR_TPL = "APR changed by {diff:.3f}% (max allowed: 0.125%)".format
+
+# Zero-tolerance fees as (display name, getter) pairs shared by LE and CD
+_ZERO_FEES = tuple(
+    (field.replace("_", " ").title(), attrgetter(field))
+    for field, bucket in MISMOLoanEstimate.TOLERANCE_BUCKETS.items()
+    if bucket == "zero"
+)
 
 
-@mcp.tool()
 async def compare_le_cd(
     loan_estimate_url: str,
-    closing_disclosure_url: str
+    closing_disclosure_url: str,
+    *,
+    le_parser=parse_loan_estimate,
+    cd_parser=parse_closing_disclosure,
 ) -> ComplianceReport:
     """
     Compare Loan Estimate vs Closing Disclosure for TRID compliance.
@@ -447,6 +666,9 @@ async def compare_le_cd(
     Args:
         loan_estimate_url: HTTPS URL to Loan Estimate PDF
         closing_disclosure_url: HTTPS URL to Closing Disclosure PDF
+        le_parser: Async callable turning the LE URL into a MISMOLoanEstimate
+            (injectable for tests; not exposed in the tool schema)
+        cd_parser: Async callable turning the CD URL into a MISMOClosingDisclosure
 
     Returns:
         Compliance report with:
@@ -462,25 +684,22 @@ async def compare_le_cd(
             for v in report.violations:
                 print(f"  - {v['description']}: ${v['amount_over']}")
     """
-    # Parse both documents
-    le = await parse_loan_estimate(loan_estimate_url)
-    cd = await parse_closing_disclosure(closing_disclosure_url)
+    # Parse both documents concurrently; either failure propagates
+    le, cd = await asyncio.gather(
+        le_parser(loan_estimate_url),
+        cd_parser(closing_disclosure_url),
+    )
 
     violations = []
     warnings = []
 
     # Check zero-tolerance items
-    zero_items = [
-        ("Origination Charges", le.origination_charges, cd.origination_charges),
-        ("Services Borrower Cannot Shop",
-         le.services_borrower_cannot_shop,
-         cd.services_borrower_cannot_shop),
-    ]
-
     zero_diff = 0.0
-    for name, le_amt, cd_amt in zero_items:
+    for name, get in _ZERO_FEES:
+        le_amt = get(le)
+        cd_amt = get(cd)
         diff = cd_amt - le_amt
-        zero_diff += max(0, diff)
+        zero_diff += diff if diff > 0.0 else 0.0
         if diff > 0.01:  # Allow 1 cent rounding
             violations.append({
                 "type": "zero_tolerance",
@@ -488,14 +707,16 @@ async def compare_le_cd(
                 "le_amount": le_amt,
                 "cd_amount": cd_amt,
                 "amount_over": diff,
-                "description": f"{name} increased by ${diff:.2f} (zero tolerance - no increase allowed)"
+                "description": _ZERO_TPL(name=name, diff=diff)
             })
 
     # Check 10% tolerance items
     ten_pct_le = le.services_borrower_can_shop
     ten_pct_cd = cd.services_borrower_can_shop
     ten_pct_limit = ten_pct_le * 0.10
-    ten_pct_diff = max(0, ten_pct_cd - ten_pct_le)
+    ten_pct_diff = ten_pct_cd - ten_pct_le
+    if ten_pct_diff < 0.0:
+        ten_pct_diff = 0.0
 
     if ten_pct_diff > ten_pct_limit:
         violations.append({
@@ -505,7 +726,7 @@ async def compare_le_cd(
             "cd_amount": ten_pct_cd,
             "amount_over": ten_pct_diff - ten_pct_limit,
             "limit": ten_pct_limit,
-            "description": f"10% tolerance exceeded by ${ten_pct_diff - ten_pct_limit:.2f}"
+            "description": _TEN_TPL(excess=ten_pct_diff - ten_pct_limit)
         })
     elif ten_pct_diff > ten_pct_limit * 0.8:
         warnings.append(
@@ -522,38 +743,21 @@ async def compare_le_cd(
             "le_amount": le.apr,
             "cd_amount": cd.apr,
             "amount_over": apr_diff - 0.125,
-            "description": f"APR changed by {apr_diff:.3f}% (max allowed: 0.125%)"
+            "description": _APR_TPL(diff=apr_diff)
         })
 
-    # Generate summary
-    is_compliant = len(violations) == 0
-
-    if is_compliant:
-        summary = (
-            f"✓ COMPLIANT: Closing Disclosure is within TRID tolerance limits. "
-            f"Zero-tolerance items: no increase. "
-            f"10% tolerance items: ${ten_pct_diff:.2f} increase "
-            f"(limit: ${ten_pct_limit:.2f}). "
-            f"APR change: {apr_diff:.3f}% (limit: 0.125%)."
-        )
-    else:
-        summary = (
-            f"✗ NOT COMPLIANT: {len(violations)} violation(s) found. "
-            f"Review required before closing."
-        )
-
+    # Summary is generated lazily by the report
     return ComplianceReport(
-        is_compliant=is_compliant,
+        is_compliant=len(violations) == 0,
         violations=violations,
         warnings=warnings,
         zero_tolerance_diff=zero_diff,
         ten_percent_diff=ten_pct_diff,
         ten_percent_limit=ten_pct_limit,
-        summary=summary
+        apr_diff=apr_diff
     )
 
 
-@mcp.tool()
 def hello(name: str = "World") -> str:
     """
     Simple greeting tool for testing MCP connectivity.
@@ -567,10 +771,261 @@ def hello(name: str = "World") -> str:
     return f"Hello, {name}! MCP server is working correctly."
 
 
+# Register the tools without rebinding their names: from fastmcp 2.7 on the
+# decorator returns a FunctionTool, and the functions must stay directly
+# callable (compare_le_cd's default parsers, tests, batch callers)
+mcp.tool()(parse_loan_estimate)
+mcp.tool()(parse_closing_disclosure)
+mcp.tool(exclude_args=["le_parser", "cd_parser"])(compare_le_cd)
+mcp.tool()(hello)
+
+
+# ============================================================================
+# Batch Compliance (NumPy)
+# ============================================================================
+
+# Column order for the (N, 7) fee arrays consumed by compare_le_cd_batch
+FEE_FIELDS = (
+    "origination_charges",
+    "services_borrower_cannot_shop",
+    "services_borrower_can_shop",
+    "taxes_and_government_fees",
+    "prepaids",
+    "initial_escrow",
+    "other_costs",
+)
+
+# Tolerance bucket masks over FEE_FIELDS
+if np is not None:
+    ZERO_MASK = np.array([1, 1, 0, 0, 0, 0, 0], dtype=bool)
+    TEN_MASK = np.array([0, 0, 1, 0, 0, 0, 0], dtype=bool)
+
+
+def _require_numpy() -> None:
+    """Fail with an install hint when a batch helper runs without NumPy"""
+    if np is None:
+        raise ImportError(
+            "Batch compliance needs NumPy: pip install 'mcp-mortgage-server[batch]'"
+        )
+
+
+# Numeric Loan Estimate fields stored column-wise by LoanEstimateBatch
+LE_NUMERIC_FIELDS = ("loan_amount", "interest_rate", "apr", "monthly_payment") + FEE_FIELDS
+
+
+class LoanEstimateBatch:
+    """
+    Column-oriented (struct-of-arrays) view over many Loan Estimates.
+
+    Each numeric field is one float64 array, so totals and tolerance checks
+    over a folder of LEs run as vector operations instead of per-model
+    attribute access. Non-numeric fields are kept per row for round-tripping.
+    """
+
+    def __init__(self, cols: dict[str, "np.ndarray"], meta: list[dict[str, Any]]):
+        self.cols = cols
+        self.meta = meta
+
+    def __len__(self) -> int:
+        return len(self.meta)
+
+    @classmethod
+    def from_models(cls, models: list[MISMOLoanEstimate]) -> "LoanEstimateBatch":
+        """Fill the column arrays from validated models"""
+        _require_numpy()
+        n = len(models)
+        cols = {name: np.empty(n, dtype=np.float64) for name in LE_NUMERIC_FIELDS}
+        meta = []
+        for i, model in enumerate(models):
+            for name in LE_NUMERIC_FIELDS:
+                cols[name][i] = getattr(model, name)
+            meta.append(model.model_dump(exclude=set(LE_NUMERIC_FIELDS)))
+        return cls(cols, meta)
+
+    def to_models(self) -> list[MISMOLoanEstimate]:
+        """Rebuild one model per row (validated, since arrays may have been edited)"""
+        return [
+            MISMOLoanEstimate(
+                **{name: float(self.cols[name][i]) for name in LE_NUMERIC_FIELDS},
+                **self.meta[i],
+            )
+            for i in range(len(self))
+        ]
+
+    def fees(self) -> "np.ndarray":
+        """Fee matrix of shape (N, 7) in FEE_FIELDS order, for compare_le_cd_batch"""
+        return np.column_stack([self.cols[name] for name in FEE_FIELDS])
+
+    @property
+    def total_closing_costs(self) -> "np.ndarray":
+        """Total closing costs per row"""
+        c = self.cols
+        return (
+            c["origination_charges"] +
+            c["services_borrower_cannot_shop"] +
+            c["services_borrower_can_shop"] +
+            c["taxes_and_government_fees"] +
+            c["prepaids"] +
+            c["initial_escrow"] +
+            c["other_costs"]
+        )
+
+
+def _as_fee_arrays(le_array: "np.ndarray", cd_array: "np.ndarray") -> tuple:
+    """Coerce both fee matrices to float64 and check they are (N, 7)"""
+    _require_numpy()
+    le_array = np.asarray(le_array, dtype=np.float64)
+    cd_array = np.asarray(cd_array, dtype=np.float64)
+    if le_array.shape != cd_array.shape or le_array.ndim != 2 or le_array.shape[1] != len(FEE_FIELDS):
+        raise ValueError(
+            f"Expected two arrays of shape (N, {len(FEE_FIELDS)}), "
+            f"got {le_array.shape} and {cd_array.shape}"
+        )
+    return le_array, cd_array
+
+
+def compare_le_cd_batch(le_array: "np.ndarray", cd_array: "np.ndarray") -> dict[str, "np.ndarray"]:
+    """
+    Check zero and 10% tolerance buckets for many LE/CD pairs at once.
+
+    Pure array kernel: no Python loop over rows. Use
+    format_batch_violations to turn the result into the violation dicts
+    compare_le_cd produces.
+
+    Args:
+        le_array: Loan Estimate fees, shape (N, 7), columns in FEE_FIELDS order
+        cd_array: Closing Disclosure fees, same shape and column order
+
+    Returns:
+        Dict of arrays:
+            zero_over: (N, 7) bool, zero tolerance fees that increased
+            ten_over: (N,) bool, rows over the 10% tolerance limit
+            amount_over: (N, 7) float, CD increase per fee (0 where it fell);
+                the 10% column holds the excess over the limit instead
+            ten_limit: (N,) float, allowed 10% increase per row
+            compliant: (N,) bool, rows with no violation
+
+    Raises:
+        ImportError: If NumPy is not installed (the "batch" extra)
+        ValueError: If the arrays are not both of shape (N, 7)
+    """
+    le_array, cd_array = _as_fee_arrays(le_array, cd_array)
+
+    amount_over = np.subtract(cd_array, le_array, out=np.empty_like(cd_array))
+    np.maximum(amount_over, 0.0, out=amount_over)
+    zero_over = (amount_over > 0.01) & ZERO_MASK  # Allow 1 cent rounding
+    ten_limit = le_array[:, TEN_MASK][:, 0] * 0.10
+    ten_excess = amount_over[:, TEN_MASK][:, 0] - ten_limit
+    ten_over = ten_excess > 0
+    amount_over[:, TEN_MASK] = np.maximum(ten_excess, 0.0)[:, None]
+
+    return {
+        "zero_over": zero_over,
+        "ten_over": ten_over,
+        "amount_over": amount_over,
+        "ten_limit": ten_limit,
+        "compliant": ~(zero_over.any(1) | ten_over),
+    }
+
+
+def format_batch_violations(
+    le_array: "np.ndarray", cd_array: "np.ndarray", checks: dict[str, "np.ndarray"]
+) -> list[list[dict[str, Any]]]:
+    """
+    Format compare_le_cd_batch results as compare_le_cd-style violation dicts.
+
+    Only flagged rows are visited, so compliant rows cost nothing here.
+
+    Returns:
+        One list of violation dicts per row (empty when the row is compliant)
+    """
+    le_array, cd_array = _as_fee_arrays(le_array, cd_array)
+    zero_over = checks["zero_over"]
+    amount_over = checks["amount_over"]
+    ten_col = int(np.flatnonzero(TEN_MASK)[0])
+
+    results: list[list[dict[str, Any]]] = [[] for _ in range(len(le_array))]
+    for row in np.flatnonzero(~checks["compliant"]):
+        violations = results[row]
+        for col in np.flatnonzero(zero_over[row]):
+            name = FEE_FIELDS[col].replace("_", " ").title()
+            diff = float(amount_over[row, col])
+            violations.append({
+                "type": "zero_tolerance",
+                "fee": name,
+                "le_amount": float(le_array[row, col]),
+                "cd_amount": float(cd_array[row, col]),
+                "amount_over": diff,
+                "description": _ZERO_TPL(name=name, diff=diff)
+            })
+        if checks["ten_over"][row]:
+            excess = float(amount_over[row, ten_col])
+            violations.append({
+                "type": "10_percent_tolerance",
+                "fee": "Services Borrower Can Shop",
+                "le_amount": float(le_array[row, ten_col]),
+                "cd_amount": float(cd_array[row, ten_col]),
+                "amount_over": excess,
+                "limit": float(checks["ten_limit"][row]),
+                "description": _TEN_TPL(excess=excess)
+            })
+
+    return results
+
+
 # ============================================================================
 # MCP Resources
 # ============================================================================
 
+# Resource bodies are static, so serialize them once at import
+# In production, load from file
+_SCHEMA_LE_JSON = orjson.dumps({
+    "schema": "MISMO 3.4 Loan Estimate",
+    "version": "3.4",
+    "fields": {
+        "LOAN_AMOUNT": {"type": "decimal", "required": True},
+        "INTEREST_RATE": {"type": "percentage", "required": True},
+        "APR": {"type": "percentage", "required": True},
+        "MONTHLY_PAYMENT": {"type": "decimal", "required": True},
+        # ... full schema would go here
+    },
+    "tolerance_rules": {
+        "zero_tolerance": [
+            "origination_charges",
+            "services_borrower_cannot_shop"
+        ],
+        "10_percent_tolerance": [
+            "services_borrower_can_shop"
+        ],
+        "unlimited_tolerance": [
+            "prepaids",
+            "property_taxes",
+            "homeowners_insurance"
+        ]
+    }
+}, option=orjson.OPT_INDENT_2).decode()
+
+_SCHEMA_CD_JSON = orjson.dumps({
+    "schema": "MISMO 3.4 Closing Disclosure",
+    "version": "3.4",
+    "note": "Similar to LE schema with additional final amounts"
+}, option=orjson.OPT_INDENT_2).decode()
+
+# Keys are uppercase to match the term.upper() lookup
+_GLOSSARY = MappingProxyType({
+    "APR": "Annual Percentage Rate - The cost of credit as a yearly rate, including interest and certain fees.",
+    "TRID": "TILA-RESPA Integrated Disclosure - Federal regulation requiring specific mortgage disclosures.",
+    "LE": "Loan Estimate - Initial disclosure provided within 3 days of application.",
+    "CD": "Closing Disclosure - Final disclosure provided at least 3 days before closing.",
+    "MISMO": "Mortgage Industry Standards Maintenance Organization - Sets data standards.",
+    "ESCROW": "Funds held by third party for taxes and insurance.",
+    "ORIGINATION": "Process of creating a new loan; includes lender fees.",
+    "TOLERANCE": "Limits on how much fees can increase from LE to CD.",
+})
+_GLOSSARY_KEYS = ", ".join(_GLOSSARY)
+_NOT_FOUND_TPL = "Term not found: {}. Available terms: {}".format
+
+
 @mcp.resource("mortgage://schemas/mismo-le")
 def get_mismo_le_schema() -> str:
     """
@@ -579,42 +1034,13 @@ def get_mismo_le_schema() -> str:
     Provides the complete field mapping and data type definitions
     for MISMO-compliant Loan Estimate documents.
     """
-    # In production, load from file
-    return json.dumps({
-        "schema": "MISMO 3.4 Loan Estimate",
-        "version": "3.4",
-        "fields": {
-            "LOAN_AMOUNT": {"type": "decimal", "required": True},
-            "INTEREST_RATE": {"type": "percentage", "required": True},
-            "APR": {"type": "percentage", "required": True},
-            "MONTHLY_PAYMENT": {"type": "decimal", "required": True},
-            # ... full schema would go here
-        },
-        "tolerance_rules": {
-            "zero_tolerance": [
-                "origination_charges",
-                "services_borrower_cannot_shop"
-            ],
-            "10_percent_tolerance": [
-                "services_borrower_can_shop"
-            ],
-            "unlimited_tolerance": [
-                "prepaids",
-                "property_taxes",
-                "homeowners_insurance"
-            ]
-        }
-    }, indent=2)
+    return _SCHEMA_LE_JSON
 
 
 @mcp.resource("mortgage://schemas/mismo-cd")
 def get_mismo_cd_schema() -> str:
     """MISMO 3.4 Closing Disclosure schema reference"""
-    return json.dumps({
-        "schema": "MISMO 3.4 Closing Disclosure",
-        "version": "3.4",
-        "note": "Similar to LE schema with additional final amounts"
-    }, indent=2)
+    return _SCHEMA_CD_JSON
 
 
 @mcp.resource("mortgage://glossary/{term}")
@@ -628,22 +1054,9 @@ def get_mortgage_glossary(term: str) -> str:
     Returns:
         Definition and explanation
     """
-    glossary = {
-        "APR": "Annual Percentage Rate - The cost of credit as a yearly rate, including interest and certain fees.",
-        "TRID": "TILA-RESPA Integrated Disclosure - Federal regulation requiring specific mortgage disclosures.",
-        "LE": "Loan Estimate - Initial disclosure provided within 3 days of application.",
-        "CD": "Closing Disclosure - Final disclosure provided at least 3 days before closing.",
-        "MISMO": "Mortgage Industry Standards Maintenance Organization - Sets data standards.",
-        "escrow": "Funds held by third party for taxes and insurance.",
-        "origination": "Process of creating a new loan; includes lender fees.",
-        "tolerance": "Limits on how much fees can increase from LE to CD.",
-    }
-
-    definition = glossary.get(term.upper())
-    if definition:
-        return f"{term.upper()}: {definition}"
-    else:
-        return f"Term not found: {term}. Available terms: {', '.join(glossary.keys())}"
+    key = term.upper()
+    definition = _GLOSSARY.get(key)
+    return f"{key}: {definition}" if definition else _NOT_FOUND_TPL(term, _GLOSSARY_KEYS)
 
 
 # ============================================================================
@@ -28,17 +28,27 @@ Released: April 12, 2024
 
 from fastapi import FastAPI, Request, HTTPException, Depends, Security
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.security.api_key import APIKeyHeader
 from pydantic import BaseModel
 from typing import Dict, Any, List
+import functools
+import hashlib
+import hmac
 import json
+import logging
+import orjson
 import os
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
 from dotenv import load_dotenv
 
+try:
+    from slowapi import Limiter, _rate_limit_exceeded_handler
+    from slowapi.errors import RateLimitExceeded
+    from slowapi.middleware import SlowAPIASGIMiddleware
+    from slowapi.util import get_remote_address
+except ImportError:  # installed without the "ratelimit" extra
+    Limiter = None
+
 # Version and metadata
 __version__ = "0.1.0"  # Following semver: MAJOR.MINOR.PATCH
 __author__ = "Confer Solutions"
@@ -52,12 +62,22 @@ __release_date__ = "2024-04-12"
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Security setup
 API_KEY_NAME = "X-API-Key"
 api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
 
+# Read once at import instead of on every request
+_API_KEY = os.environ.get("API_KEY", "").encode()
+
+@functools.lru_cache(maxsize=1024)
+def _is_valid_api_key(key: bytes) -> bool:
+    # Constant-time compare; repeat callers hit the cache
+    return hmac.compare_digest(key, _API_KEY)
+
 async def get_api_key(api_key_header: str = Security(api_key_header)):
-    if api_key_header == os.getenv("API_KEY"):
+    if _API_KEY and api_key_header and _is_valid_api_key(api_key_header.encode()):
         return api_key_header
     raise HTTPException(
         status_code=403,
@@ -65,11 +85,29 @@ async def get_api_key(api_key_header: str = Security(api_key_header)):
     )
 
 # Rate limiting setup
+class _NoLimiter:
+    """Stand-in used when slowapi is not installed: routes are not rate limited"""
+
+    def limit(self, *args, **kwargs):
+        return lambda func: func
+
+    def exempt(self, func):
+        return func
+
 RATE_LIMIT = os.getenv("RATE_LIMIT_PER_MINUTE", "120")
-limiter = Limiter(
-    key_func=get_remote_address,
-    default_limits=[f"{RATE_LIMIT}/minute"]
-)
+# Counters live in process memory unless a shared backend is configured
+# (e.g. redis://host:6379); with several workers each one would otherwise
+# allow RATE_LIMIT on its own
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+if Limiter is not None:
+    limiter = Limiter(
+        key_func=get_remote_address,
+        default_limits=[f"{RATE_LIMIT}/minute"],
+        storage_uri=RATE_LIMIT_STORAGE_URI,
+    )
+else:
+    logger.warning("slowapi is not installed; rate limiting is disabled")
+    limiter = _NoLimiter()
 
 app = FastAPI(
     title="MCP Server",
@@ -78,8 +116,17 @@ app = FastAPI(
     docs_url="/docs",  # Enable Swagger UI
     redoc_url="/redoc"  # Enable ReDoc
 )
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+if Limiter is not None:
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    # Pure ASGI variant: no extra task per request as with BaseHTTPMiddleware
+    app.add_middleware(SlowAPIASGIMiddleware)
+    # The middleware applies default_limits to every undecorated route; keep the
+    # built-in docs routes unthrottled, as they were before it was registered
+    _DOCS_PATHS = {app.openapi_url, app.docs_url, app.swagger_ui_oauth2_redirect_url, app.redoc_url}
+    for route in app.routes:
+        if getattr(route, "path", None) in _DOCS_PATHS:
+            limiter.exempt(route.endpoint)
 
 # CORS middleware configuration
 ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
@@ -137,20 +184,47 @@ MCP_CONFIG = {
     ]
 }
 
+# Built once at import: O(1) tool lookup and a reusable /tools payload
+_TOOLS_BY_NAME: dict[str, dict[str, Any]] = {t["name"]: t for t in MCP_CONFIG["tools"]}
+_TOOLS_LIST_RESPONSE = {"tools": MCP_CONFIG["tools"]}
+
+# The tool catalog is static: serialize it once and let clients revalidate by ETag
+_TOOLS_BODY = orjson.dumps(_TOOLS_LIST_RESPONSE)
+_TOOLS_ETAG = f'"{hashlib.md5(_TOOLS_BODY).hexdigest()}"'
+# /tools is behind the API key, so shared caches must key responses on the credentials
+_TOOLS_HEADERS = {
+    "ETag": _TOOLS_ETAG,
+    "Cache-Control": "public, max-age=300",
+    "Vary": "X-API-Key, Authorization",
+}
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
 class ToolRequest(BaseModel):
     tool: str
     input: Dict[str, Any]
 
+async def _tool_hello(input_data: dict[str, Any]) -> str:
+    name = input_data.get("name", "World")
+    return f"Hello, {name}!"
+
+# Tool name -> async handler (see the contract in call_tool)
+_TOOL_HANDLERS = {
+    "hello": _tool_hello,
+}
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
+    # Keep the message in the logs; clients only see the exception type
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path)
     return JSONResponse(
+        {"detail": "Internal Server Error", "type": type(exc).__name__},
         status_code=500,
-        content={"detail": str(exc), "type": type(exc).__name__}
     )
 
 @app.get("/health")
+@limiter.exempt  # load balancer and Docker health checks must never be throttled
 async def health_check():
-    return {"status": "healthy"}
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 @app.get("/tools")
 @limiter.limit(f"{RATE_LIMIT}/minute")
@@ -158,7 +232,9 @@ async def list_tools(
     request: Request,
     api_key: str = Depends(get_api_key)
 ):
-    return {"tools": MCP_CONFIG["tools"]}
+    if request.headers.get("if-none-match") == _TOOLS_ETAG:
+        return Response(status_code=304, headers=_TOOLS_HEADERS)
+    return Response(_TOOLS_BODY, media_type="application/json", headers=_TOOLS_HEADERS)
 
 @app.post("/call")
 @limiter.limit(f"{RATE_LIMIT}/minute")
@@ -166,29 +242,57 @@ async def call_tool(
     request: Request,
     tool_request: ToolRequest,
     api_key: str = Depends(get_api_key)
-):
+) -> dict[str, Any]:
+    """
+    Dispatch a tool call.
+
+    Handler contract: every handler in _TOOL_HANDLERS must be `async def` and
+    must never block the event loop. Do network I/O with httpx.AsyncClient and
+    file I/O with aiofiles (never requests/open); wrap CPU-bound work such as
+    PDF parsing in `await asyncio.to_thread(...)`. A blocking handler stalls
+    every other in-flight request on the worker.
+    """
     tool_name = tool_request.tool
     input_data = tool_request.input
 
     # Validate tool exists
-    tool_config = next((t for t in MCP_CONFIG["tools"] if t["name"] == tool_name), None)
+    tool_config = _TOOLS_BY_NAME.get(tool_name)
     if not tool_config:
         raise HTTPException(status_code=404, detail=f"Tool {tool_name} not found")
 
+    handler = _TOOL_HANDLERS.get(tool_name)
+    if handler is None:
+        raise HTTPException(status_code=400, detail="Unknown tool")
+
     try:
-        if tool_name == "hello":
-            name = input_data.get("name", "World")
-            return {"output": f"Hello, {name}!"}
-        else:
-            raise HTTPException(status_code=400, detail="Unknown tool")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        return {"output": await handler(input_data)}
+    except Exception:
+        # Exception text can carry paths, URLs or parser internals; log it only
+        logger.exception("Tool %s failed", tool_name)
+        raise HTTPException(status_code=500, detail="Internal Server Error") from None
 
 if __name__ == "__main__":
+    # Development entry point; in production run under Gunicorn with
+    # `gunicorn -c gunicorn_conf.py server_old:app` (preloads the app)
     import uvicorn
+    # Default to the usual 2*CPU+1 worker count only when rate-limit counters
+    # are shared; with in-memory counters extra workers multiply the limit.
+    # uvicorn only spawns multiple workers when the app is given as an import
+    # string, which must name an importable module (server_old.py re-exports it)
+    if RATE_LIMIT_STORAGE_URI.startswith("memory://"):
+        default_workers = 1
+    else:
+        default_workers = 2 * (os.cpu_count() or 1) + 1
+    workers = int(os.getenv("WORKERS", default_workers))
     uvicorn.run(
-        app,
+        app if workers == 1 else "server_old:app",
         host=os.getenv("HOST", "0.0.0.0"),
         port=int(os.getenv("PORT", 8001)),
-        workers=int(os.getenv("WORKERS", 1))
-    ) 
\ No newline at end of file
+        workers=workers,
+        limit_concurrency=int(os.getenv("LIMIT_CONCURRENCY", 1000)),
+        backlog=int(os.getenv("BACKLOG", 2048)),
+        timeout_keep_alive=int(os.getenv("KEEPALIVE", 5)),
+        # uvloop/httptools when installed (uvloop has no Windows build), else asyncio/h11
+        loop="auto",
+        http="auto"
+    )
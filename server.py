@@ -33,13 +33,27 @@ License: MIT
 """
 
 import asyncio
-import json
+import functools
+import importlib.metadata
 import os
-from typing import Any, Dict, Optional
+from collections.abc import Mapping
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Optional
 from urllib.parse import urlparse
 
 import httpx
-from pydantic import BaseModel, Field, field_validator
+import orjson
+from async_lru import alru_cache
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    field_validator,
+    model_validator,
+)
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -58,39 +72,113 @@ from mcp.types import (
 # Configuration
 # ============================================================================
 
-__version__ = "2.0.0"
 __author__ = "Confer Solutions"
 
+
+def __getattr__(name: str) -> Any:
+    """Resolve __version__ lazily from the installed package metadata"""
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        version = importlib.metadata.version(__package__ or "mcp-mortgage-server")
+    except importlib.metadata.PackageNotFoundError:  # running from a source checkout
+        version = Path(__file__).with_name("_version.txt").read_text().strip()
+    globals()["__version__"] = version
+    return version
+
+
 # Security: Allowed PDF source domains (prevent SSRF)
-ALLOWED_DOMAINS = os.getenv(
-    "ALLOWED_DOMAINS", "storage.googleapis.com,s3.amazonaws.com,mortgage-docs.confer.ai"
-).split(",")
+ALLOWED_DOMAINS = frozenset(
+    os.getenv(
+        "ALLOWED_DOMAINS", "storage.googleapis.com,s3.amazonaws.com,mortgage-docs.confer.ai"
+    ).split(",")
+)
 
 MAX_PDF_SIZE = int(os.getenv("MAX_PDF_SIZE", 10 * 1024 * 1024))  # 10MB
 DOWNLOAD_TIMEOUT = int(os.getenv("DOWNLOAD_TIMEOUT", 30))  # seconds
+COMPARE_CACHE_TTL = int(os.getenv("COMPARE_CACHE_TTL", 300))  # seconds
+COMPARE_CACHE_SIZE = int(os.getenv("COMPARE_CACHE_SIZE", 128))
+MAX_CONCURRENT_DOWNLOADS = int(os.getenv("MAX_CONCURRENT_DOWNLOADS", 8))
+
+# Shared client so repeated downloads reuse pooled keep-alive (HTTP/2) connections
+_HTTP_CLIENT = httpx.AsyncClient(
+    timeout=DOWNLOAD_TIMEOUT,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+    follow_redirects=True,
+)
+
+# Caps in-flight PDF streams (each buffered up to MAX_PDF_SIZE) per process
+_DOWNLOAD_SEM = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
 
 # ============================================================================
 # Data Models (Pydantic)
 # ============================================================================
 
+# Amounts and rates are Decimal so tolerance checks are exact to the cent
+_MONEY = {"max_digits": 12, "decimal_places": 2}
+_RATE = {"max_digits": 7, "decimal_places": 4}
+_CENT = Decimal("0.01")
+_RATE_STEP = Decimal("0.0001")
+
+_MONEY_FIELDS = (
+    "loan_amount",
+    "monthly_payment",
+    "origination_charges",
+    "services_borrower_cannot_shop",
+    "services_borrower_can_shop",
+    "taxes_and_government_fees",
+    "prepaids",
+    "initial_escrow",
+    "other_costs",
+)
+_RATE_FIELDS = ("interest_rate", "apr")
+
+
+def _quantize(value: Any, step: Decimal) -> Any:
+    """Round a parsed number to `step` so float noise (1896.204) isn't rejected"""
+    if isinstance(value, bool) or not isinstance(value, (int, float, str, Decimal)):
+        return value
+    try:
+        return Decimal(str(value)).quantize(step)
+    except InvalidOperation:
+        return value  # let the field's own validation report it
+
 
 class MISMOLoanEstimate(BaseModel):
     """MISMO-compliant Loan Estimate data structure"""
 
+    model_config = ConfigDict(extra="forbid")
+
+    # TRID tolerance bucket for each fee field (fees not listed have unlimited tolerance)
+    TOLERANCE_BUCKETS: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "origination_charges": "zero",
+            "services_borrower_cannot_shop": "zero",
+            "services_borrower_can_shop": "10_percent",
+        }
+    )
+
     # Loan Information
-    loan_amount: float = Field(..., gt=0, lt=100_000_000, description="Total loan amount in USD")
-    interest_rate: float = Field(..., ge=0, le=100, description="Interest rate as percentage")
-    apr: float = Field(..., ge=0, le=100, description="Annual Percentage Rate")
-    monthly_payment: float = Field(..., gt=0, description="Monthly principal and interest payment")
+    loan_amount: Decimal = Field(
+        ..., gt=0, lt=100_000_000, **_MONEY, description="Total loan amount in USD"
+    )
+    interest_rate: Decimal = Field(
+        ..., ge=0, le=100, **_RATE, description="Interest rate as percentage"
+    )
+    apr: Decimal = Field(..., ge=0, le=100, **_RATE, description="Annual Percentage Rate")
+    monthly_payment: Decimal = Field(
+        ..., gt=0, **_MONEY, description="Monthly principal and interest payment"
+    )
 
     # Closing Costs
-    origination_charges: float = Field(default=0, ge=0)
-    services_borrower_cannot_shop: float = Field(default=0, ge=0)
-    services_borrower_can_shop: float = Field(default=0, ge=0)
-    taxes_and_government_fees: float = Field(default=0, ge=0)
-    prepaids: float = Field(default=0, ge=0)
-    initial_escrow: float = Field(default=0, ge=0)
-    other_costs: float = Field(default=0, ge=0)
+    origination_charges: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
+    services_borrower_cannot_shop: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
+    services_borrower_can_shop: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
+    taxes_and_government_fees: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
+    prepaids: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
+    initial_escrow: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
+    other_costs: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
 
     # Metadata
     lender_name: Optional[str] = None
@@ -101,6 +189,24 @@ class MISMOLoanEstimate(BaseModel):
     # Compliance
     tolerance_buckets: Dict[str, str] = Field(default_factory=dict)
 
+    @model_validator(mode="before")
+    @classmethod
+    def _drop_computed(cls, data: Any) -> Any:
+        # total_closing_costs is serialized but derived; accept dumps fed back in
+        if isinstance(data, dict) and "total_closing_costs" in data:
+            data = {k: v for k, v in data.items() if k != "total_closing_costs"}
+        return data
+
+    @field_validator(*_MONEY_FIELDS, mode="before")
+    @classmethod
+    def _round_money(cls, v: Any) -> Any:
+        return _quantize(v, _CENT)
+
+    @field_validator(*_RATE_FIELDS, mode="before")
+    @classmethod
+    def _round_rate(cls, v: Any) -> Any:
+        return _quantize(v, _RATE_STEP)
+
     @field_validator("loan_amount")
     @classmethod
     def validate_reasonable_loan(cls, v):
@@ -108,48 +214,61 @@ class MISMOLoanEstimate(BaseModel):
             raise ValueError("Loan amount too small (< $1,000)")
         return v
 
+    @computed_field
     @property
-    def total_closing_costs(self) -> float:
-        return sum(
-            [
-                self.origination_charges,
-                self.services_borrower_cannot_shop,
-                self.services_borrower_can_shop,
-                self.taxes_and_government_fees,
-                self.prepaids,
-                self.initial_escrow,
-                self.other_costs,
-            ]
+    def total_closing_costs(self) -> Decimal:
+        return (
+            self.origination_charges
+            + self.services_borrower_cannot_shop
+            + self.services_borrower_can_shop
+            + self.taxes_and_government_fees
+            + self.prepaids
+            + self.initial_escrow
+            + self.other_costs
         )
 
 
 class MISMOClosingDisclosure(BaseModel):
     """MISMO-compliant Closing Disclosure data structure"""
 
-    loan_amount: float = Field(..., gt=0)
-    interest_rate: float = Field(..., ge=0, le=100)
-    apr: float = Field(..., ge=0, le=100)
-    monthly_payment: float = Field(..., gt=0)
-    origination_charges: float = Field(default=0, ge=0)
-    services_borrower_cannot_shop: float = Field(default=0, ge=0)
-    services_borrower_can_shop: float = Field(default=0, ge=0)
-    taxes_and_government_fees: float = Field(default=0, ge=0)
-    prepaids: float = Field(default=0, ge=0)
-    initial_escrow: float = Field(default=0, ge=0)
-    other_costs: float = Field(default=0, ge=0)
-    cash_to_close: float
+    model_config = ConfigDict(extra="forbid")
+
+    loan_amount: Decimal = Field(..., gt=0, **_MONEY)
+    interest_rate: Decimal = Field(..., ge=0, le=100, **_RATE)
+    apr: Decimal = Field(..., ge=0, le=100, **_RATE)
+    monthly_payment: Decimal = Field(..., gt=0, **_MONEY)
+    origination_charges: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
+    services_borrower_cannot_shop: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
+    services_borrower_can_shop: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
+    taxes_and_government_fees: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
+    prepaids: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
+    initial_escrow: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
+    other_costs: Decimal = Field(default=Decimal(0), ge=0, **_MONEY)
+    cash_to_close: Decimal = Field(..., **_MONEY)
     closing_date: Optional[str] = None
 
+    @field_validator(*_MONEY_FIELDS, "cash_to_close", mode="before")
+    @classmethod
+    def _round_money(cls, v: Any) -> Any:
+        return _quantize(v, _CENT)
+
+    @field_validator(*_RATE_FIELDS, mode="before")
+    @classmethod
+    def _round_rate(cls, v: Any) -> Any:
+        return _quantize(v, _RATE_STEP)
+
 
 class ComplianceReport(BaseModel):
     """TRID compliance comparison report"""
 
+    model_config = ConfigDict(extra="forbid")
+
     is_compliant: bool
     violations: list[Dict[str, Any]] = Field(default_factory=list)
     warnings: list[str] = Field(default_factory=list)
-    zero_tolerance_diff: float = 0.0
-    ten_percent_diff: float = 0.0
-    ten_percent_limit: float = 0.0
+    zero_tolerance_diff: Decimal = Decimal(0)
+    ten_percent_diff: Decimal = Decimal(0)
+    ten_percent_limit: Decimal = Decimal(0)
     summary: str = ""
 
 
@@ -167,31 +286,49 @@ def validate_pdf_url(url: str) -> bool:
 
     if parsed.netloc not in ALLOWED_DOMAINS:
         raise ValueError(
-            f"Domain not allowed: {parsed.netloc}. " f"Allowed: {', '.join(ALLOWED_DOMAINS)}"
+            f"Domain not allowed: {parsed.netloc}. "
+            f"Allowed: {', '.join(sorted(ALLOWED_DOMAINS))}"
         )
 
-    if not parsed.path.lower().endswith(".pdf"):
+    if os.path.splitext(parsed.path)[1].lower() != ".pdf":
         raise ValueError("Only PDF files allowed")
 
     return True
 
 
+@functools.lru_cache(maxsize=256)
+def _is_pdf_head(head: bytes) -> bool:
+    """Check the leading bytes of a download for the %PDF magic number"""
+    return head.startswith(b"%PDF")
+
+
 async def download_pdf(url: str) -> bytes:
     """Safely download PDF with size and timeout limits"""
     validate_pdf_url(url)
 
-    async with httpx.AsyncClient(timeout=DOWNLOAD_TIMEOUT) as client:
-        response = await client.get(url, follow_redirects=True)
-        response.raise_for_status()
+    async with _DOWNLOAD_SEM:
+        # Stream the body and stop as soon as it exceeds the size cap
+        async with _HTTP_CLIENT.stream("GET", url) as response:
+            response.raise_for_status()
+
+            limit = MAX_PDF_SIZE
+            buf = bytearray()
+            magic_checked = False
+            async for chunk in response.aiter_bytes(chunk_size=65536):
+                buf += chunk
+                if len(buf) > limit:
+                    raise ValueError(f"PDF too large: exceeds {limit} bytes")
 
-        content = response.content
-        if len(content) > MAX_PDF_SIZE:
-            raise ValueError(f"PDF too large: {len(content)} bytes (max: {MAX_PDF_SIZE})")
+                # Reject non-PDF bodies (e.g. HTML error pages) before reading the rest
+                if not magic_checked and len(buf) >= 4:
+                    if not _is_pdf_head(bytes(buf[:8])):
+                        raise ValueError("File does not appear to be a valid PDF")
+                    magic_checked = True
 
-        if not content.startswith(b"%PDF"):
-            raise ValueError("File does not appear to be a valid PDF")
+            if not magic_checked:
+                raise ValueError("File does not appear to be a valid PDF")
 
-        return content
+            return bytes(buf)
 
 
 # ============================================================================
@@ -251,6 +388,29 @@ async def parse_cd_pdf_content(pdf_bytes: bytes) -> Dict[str, Any]:
 # Tool Implementations
 # ============================================================================
 
+# TRID tolerance thresholds
+_CENT = Decimal("0.01")
+_TEN_PERCENT = Decimal("0.10")
+_APR_TOLERANCE = Decimal("0.125")
+
+# (field, display name) pairs per tolerance bucket, resolved once from the model
+_ZERO_TOLERANCE_FEES = tuple(
+    (field, field.replace("_", " ").title())
+    for field, bucket in MISMOLoanEstimate.TOLERANCE_BUCKETS.items()
+    if bucket == "zero"
+)
+_TEN_PERCENT_FEES = tuple(
+    (field, field.replace("_", " ").title())
+    for field, bucket in MISMOLoanEstimate.TOLERANCE_BUCKETS.items()
+    if bucket == "10_percent"
+)
+_TEN_PERCENT_LABEL = " + ".join(name for _, name in _TEN_PERCENT_FEES)
+
+
+def _dumps(payload: dict[str, Any]) -> str:
+    """Serialize a tool payload, emitting Decimal amounts as JSON numbers"""
+    return orjson.dumps(payload, default=float, option=orjson.OPT_INDENT_2).decode()
+
 
 async def tool_parse_loan_estimate(arguments: dict) -> list[TextContent]:
     """Parse a Loan Estimate PDF into MISMO-compliant structured data"""
@@ -270,26 +430,7 @@ async def tool_parse_loan_estimate(arguments: dict) -> list[TextContent]:
     return [
         TextContent(
             type="text",
-            text=json.dumps(
-                {
-                    "loan_amount": le.loan_amount,
-                    "interest_rate": le.interest_rate,
-                    "apr": le.apr,
-                    "monthly_payment": le.monthly_payment,
-                    "total_closing_costs": le.total_closing_costs,
-                    "origination_charges": le.origination_charges,
-                    "services_borrower_cannot_shop": le.services_borrower_cannot_shop,
-                    "services_borrower_can_shop": le.services_borrower_can_shop,
-                    "taxes_and_government_fees": le.taxes_and_government_fees,
-                    "prepaids": le.prepaids,
-                    "initial_escrow": le.initial_escrow,
-                    "other_costs": le.other_costs,
-                    "lender_name": le.lender_name,
-                    "loan_term_months": le.loan_term_months,
-                    "tolerance_buckets": le.tolerance_buckets,
-                },
-                indent=2,
-            ),
+            text=_dumps(le.model_dump()),
         )
     ]
 
@@ -304,7 +445,7 @@ async def tool_parse_closing_disclosure(arguments: dict) -> list[TextContent]:
     data = await parse_cd_pdf_content(pdf_content)
     cd = MISMOClosingDisclosure(**data)
 
-    return [TextContent(type="text", text=json.dumps(cd.dict(), indent=2))]
+    return [TextContent(type="text", text=_dumps(cd.model_dump()))]
 
 
 async def tool_compare_le_cd(arguments: dict) -> list[TextContent]:
@@ -315,12 +456,18 @@ async def tool_compare_le_cd(arguments: dict) -> list[TextContent]:
     if not le_url or not cd_url:
         raise ValueError("Both loan_estimate_url and closing_disclosure_url are required")
 
-    # Parse both documents
-    le_content = await download_pdf(le_url)
-    cd_content = await download_pdf(cd_url)
+    return [TextContent(type="text", text=await _cached_compare(le_url, cd_url))]
+
 
-    le_data = await parse_le_pdf_content(le_content)
-    cd_data = await parse_cd_pdf_content(cd_content)
+@alru_cache(maxsize=COMPARE_CACHE_SIZE, ttl=COMPARE_CACHE_TTL)
+async def _cached_compare(le_url: str, cd_url: str) -> str:
+    """Build the compliance report JSON for an LE/CD URL pair, cached briefly per pair"""
+    # Download and parse both documents concurrently
+    le_content, cd_content = await asyncio.gather(download_pdf(le_url), download_pdf(cd_url))
+
+    le_data, cd_data = await asyncio.gather(
+        parse_le_pdf_content(le_content), parse_cd_pdf_content(cd_content)
+    )
 
     le = MISMOLoanEstimate(**le_data)
     cd = MISMOClosingDisclosure(**cd_data)
@@ -330,20 +477,13 @@ async def tool_compare_le_cd(arguments: dict) -> list[TextContent]:
     warnings = []
 
     # Check zero-tolerance items
-    zero_items = [
-        ("Origination Charges", le.origination_charges, cd.origination_charges),
-        (
-            "Services Borrower Cannot Shop",
-            le.services_borrower_cannot_shop,
-            cd.services_borrower_cannot_shop,
-        ),
-    ]
-
-    zero_diff = 0.0
-    for name, le_amt, cd_amt in zero_items:
+    zero_diff = Decimal(0)
+    for field, name in _ZERO_TOLERANCE_FEES:
+        le_amt = getattr(le, field)
+        cd_amt = getattr(cd, field)
         diff = cd_amt - le_amt
         zero_diff += max(0, diff)
-        if diff > 0.01:
+        if diff > _CENT:
             violations.append(
                 {
                     "type": "zero_tolerance",
@@ -355,17 +495,17 @@ async def tool_compare_le_cd(arguments: dict) -> list[TextContent]:
                 }
             )
 
-    # Check 10% tolerance
-    ten_pct_le = le.services_borrower_can_shop
-    ten_pct_cd = cd.services_borrower_can_shop
-    ten_pct_limit = ten_pct_le * 0.10
+    # Check 10% tolerance (applies to the bucket's aggregate)
+    ten_pct_le = sum((getattr(le, field) for field, _ in _TEN_PERCENT_FEES), Decimal(0))
+    ten_pct_cd = sum((getattr(cd, field) for field, _ in _TEN_PERCENT_FEES), Decimal(0))
+    ten_pct_limit = ten_pct_le * _TEN_PERCENT
     ten_pct_diff = max(0, ten_pct_cd - ten_pct_le)
 
     if ten_pct_diff > ten_pct_limit:
         violations.append(
             {
                 "type": "10_percent_tolerance",
-                "fee": "Services Borrower Can Shop",
+                "fee": _TEN_PERCENT_LABEL,
                 "le_amount": ten_pct_le,
                 "cd_amount": ten_pct_cd,
                 "amount_over": ten_pct_diff - ten_pct_limit,
@@ -376,7 +516,7 @@ async def tool_compare_le_cd(arguments: dict) -> list[TextContent]:
 
     # Check APR accuracy
     apr_diff = abs(cd.apr - le.apr)
-    if apr_diff > 0.125:
+    if apr_diff > _APR_TOLERANCE:
         violations.append(
             {
                 "type": "apr_accuracy",
@@ -400,7 +540,7 @@ async def tool_compare_le_cd(arguments: dict) -> list[TextContent]:
         summary=summary,
     )
 
-    return [TextContent(type="text", text=json.dumps(report.dict(), indent=2))]
+    return _dumps(report.model_dump())
 
 
 async def tool_hello(arguments: dict) -> list[TextContent]:
@@ -409,6 +549,152 @@ async def tool_hello(arguments: dict) -> list[TextContent]:
     return [TextContent(type="text", text=f"Hello, {name}! MCP server is working correctly.")]
 
 
+# ============================================================================
+# Static Resources
+# ============================================================================
+
+_RESOURCE_PAYLOADS: dict[str, dict[str, Any]] = {
+    "mortgage://schemas/mismo-le": {
+        "schema": "MISMO 3.4 Loan Estimate",
+        "version": "3.4",
+        "tolerance_rules": {
+            "zero_tolerance": ["origination_charges", "services_borrower_cannot_shop"],
+            "10_percent_tolerance": ["services_borrower_can_shop"],
+            "unlimited_tolerance": [
+                "prepaids",
+                "property_taxes",
+                "homeowners_insurance",
+            ],
+        },
+    },
+    "mortgage://schemas/mismo-cd": {"schema": "MISMO 3.4 Closing Disclosure", "version": "3.4"},
+    "mortgage://glossary/terms": {
+        "APR": "Annual Percentage Rate - The cost of credit as a yearly rate",
+        "TRID": "TILA-RESPA Integrated Disclosure",
+        "LE": "Loan Estimate",
+        "CD": "Closing Disclosure",
+        "MISMO": "Mortgage Industry Standards Maintenance Organization",
+    },
+}
+
+# Resource bodies never change, so serialize them once at import
+_RESOURCE_BODIES: dict[str, str] = {
+    uri: orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+    for uri, payload in _RESOURCE_PAYLOADS.items()
+}
+
+
+# ============================================================================
+# Static Catalog
+# ============================================================================
+
+# Tool, resource and prompt listings are static, so build the models once at import
+_TOOLS: list[Tool] = [
+    Tool(
+        name="hello",
+        description="Simple greeting tool for testing MCP connectivity",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name to greet (default: World)"}
+            },
+        },
+    ),
+    Tool(
+        name="parse_loan_estimate",
+        description=(
+            "Parse a Loan Estimate PDF into MISMO-compliant structured data. "
+            "⚠️ REQUIRES APPROVAL: Downloads external PDF document. "
+            "Security: Only approved domains allowed, 10MB limit, 30s timeout."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pdf_url": {
+                    "type": "string",
+                    "description": "HTTPS URL to Loan Estimate PDF (allowed domains: storage.googleapis.com, s3.amazonaws.com)",
+                }
+            },
+            "required": ["pdf_url"],
+        },
+    ),
+    Tool(
+        name="parse_closing_disclosure",
+        description=(
+            "Parse a Closing Disclosure PDF into MISMO-compliant structured data. "
+            "⚠️ REQUIRES APPROVAL: Downloads external PDF document."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pdf_url": {
+                    "type": "string",
+                    "description": "HTTPS URL to Closing Disclosure PDF",
+                }
+            },
+            "required": ["pdf_url"],
+        },
+    ),
+    Tool(
+        name="compare_le_cd",
+        description=(
+            "Compare Loan Estimate vs Closing Disclosure for TRID compliance. "
+            "⚠️ REQUIRES APPROVAL: Downloads and compares two PDF documents. "
+            "Checks for zero-tolerance, 10% tolerance, and APR violations."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "loan_estimate_url": {
+                    "type": "string",
+                    "description": "HTTPS URL to Loan Estimate PDF",
+                },
+                "closing_disclosure_url": {
+                    "type": "string",
+                    "description": "HTTPS URL to Closing Disclosure PDF",
+                },
+            },
+            "required": ["loan_estimate_url", "closing_disclosure_url"],
+        },
+    ),
+]
+
+_RESOURCES: list[Resource] = [
+    Resource(
+        uri="mortgage://schemas/mismo-le",
+        name="MISMO Loan Estimate Schema",
+        mimeType="application/json",
+        description="MISMO 3.4 Loan Estimate schema reference",
+    ),
+    Resource(
+        uri="mortgage://schemas/mismo-cd",
+        name="MISMO Closing Disclosure Schema",
+        mimeType="application/json",
+        description="MISMO 3.4 Closing Disclosure schema reference",
+    ),
+    Resource(
+        uri="mortgage://glossary/terms",
+        name="Mortgage Glossary",
+        mimeType="application/json",
+        description="Mortgage terminology definitions",
+    ),
+]
+
+_PROMPTS: list[Prompt] = [
+    Prompt(
+        name="analyze_loan_estimate",
+        description="Structured workflow for analyzing a Loan Estimate",
+        arguments=[
+            {
+                "name": "analysis_type",
+                "description": "Type of analysis: quick, comprehensive, or compliance",
+                "required": False,
+            }
+        ],
+    ),
+]
+
+
 # ============================================================================
 # MCP Server Setup
 # ============================================================================
@@ -421,75 +707,7 @@ async def main():
     # Register tools
     @server.list_tools()
     async def list_tools() -> list[Tool]:
-        return [
-            Tool(
-                name="hello",
-                description="Simple greeting tool for testing MCP connectivity",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "Name to greet (default: World)"}
-                    },
-                },
-            ),
-            Tool(
-                name="parse_loan_estimate",
-                description=(
-                    "Parse a Loan Estimate PDF into MISMO-compliant structured data. "
-                    "⚠️ REQUIRES APPROVAL: Downloads external PDF document. "
-                    "Security: Only approved domains allowed, 10MB limit, 30s timeout."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "pdf_url": {
-                            "type": "string",
-                            "description": "HTTPS URL to Loan Estimate PDF (allowed domains: storage.googleapis.com, s3.amazonaws.com)",
-                        }
-                    },
-                    "required": ["pdf_url"],
-                },
-            ),
-            Tool(
-                name="parse_closing_disclosure",
-                description=(
-                    "Parse a Closing Disclosure PDF into MISMO-compliant structured data. "
-                    "⚠️ REQUIRES APPROVAL: Downloads external PDF document."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "pdf_url": {
-                            "type": "string",
-                            "description": "HTTPS URL to Closing Disclosure PDF",
-                        }
-                    },
-                    "required": ["pdf_url"],
-                },
-            ),
-            Tool(
-                name="compare_le_cd",
-                description=(
-                    "Compare Loan Estimate vs Closing Disclosure for TRID compliance. "
-                    "⚠️ REQUIRES APPROVAL: Downloads and compares two PDF documents. "
-                    "Checks for zero-tolerance, 10% tolerance, and APR violations."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "loan_estimate_url": {
-                            "type": "string",
-                            "description": "HTTPS URL to Loan Estimate PDF",
-                        },
-                        "closing_disclosure_url": {
-                            "type": "string",
-                            "description": "HTTPS URL to Closing Disclosure PDF",
-                        },
-                    },
-                    "required": ["loan_estimate_url", "closing_disclosure_url"],
-                },
-            ),
-        ]
+        return _TOOLS
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[TextContent]:
@@ -508,81 +726,20 @@ async def main():
     # Register resources
     @server.list_resources()
     async def list_resources() -> list[Resource]:
-        return [
-            Resource(
-                uri="mortgage://schemas/mismo-le",
-                name="MISMO Loan Estimate Schema",
-                mimeType="application/json",
-                description="MISMO 3.4 Loan Estimate schema reference",
-            ),
-            Resource(
-                uri="mortgage://schemas/mismo-cd",
-                name="MISMO Closing Disclosure Schema",
-                mimeType="application/json",
-                description="MISMO 3.4 Closing Disclosure schema reference",
-            ),
-            Resource(
-                uri="mortgage://glossary/terms",
-                name="Mortgage Glossary",
-                mimeType="application/json",
-                description="Mortgage terminology definitions",
-            ),
-        ]
+        return _RESOURCES
 
     @server.read_resource()
     async def read_resource(uri: str) -> str:
         """Read resource content"""
-        if uri == "mortgage://schemas/mismo-le":
-            return json.dumps(
-                {
-                    "schema": "MISMO 3.4 Loan Estimate",
-                    "version": "3.4",
-                    "tolerance_rules": {
-                        "zero_tolerance": ["origination_charges", "services_borrower_cannot_shop"],
-                        "10_percent_tolerance": ["services_borrower_can_shop"],
-                        "unlimited_tolerance": [
-                            "prepaids",
-                            "property_taxes",
-                            "homeowners_insurance",
-                        ],
-                    },
-                },
-                indent=2,
-            )
-        elif uri == "mortgage://schemas/mismo-cd":
-            return json.dumps(
-                {"schema": "MISMO 3.4 Closing Disclosure", "version": "3.4"}, indent=2
-            )
-        elif uri == "mortgage://glossary/terms":
-            return json.dumps(
-                {
-                    "APR": "Annual Percentage Rate - The cost of credit as a yearly rate",
-                    "TRID": "TILA-RESPA Integrated Disclosure",
-                    "LE": "Loan Estimate",
-                    "CD": "Closing Disclosure",
-                    "MISMO": "Mortgage Industry Standards Maintenance Organization",
-                },
-                indent=2,
-            )
-        else:
+        body = _RESOURCE_BODIES.get(uri)
+        if body is None:
             raise ValueError(f"Unknown resource: {uri}")
+        return body
 
     # Register prompts
     @server.list_prompts()
     async def list_prompts() -> list[Prompt]:
-        return [
-            Prompt(
-                name="analyze_loan_estimate",
-                description="Structured workflow for analyzing a Loan Estimate",
-                arguments=[
-                    {
-                        "name": "analysis_type",
-                        "description": "Type of analysis: quick, comprehensive, or compliance",
-                        "required": False,
-                    }
-                ],
-            ),
-        ]
+        return _PROMPTS
 
     @server.get_prompt()
     async def get_prompt(name: str, arguments: dict) -> GetPromptResult:
@@ -638,13 +795,27 @@ Should borrower shop around? Negotiate?""",
         raise ValueError(f"Unknown prompt: {name}")
 
     # Run server with stdio transport
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        await _HTTP_CLIENT.aclose()
 
 
 # ============================================================================
 # Entry Point
 # ============================================================================
 
+
+def run():
+    """Console-script entry point: run the stdio server on uvloop when available"""
+    try:
+        import uvloop
+    except ImportError:  # uvloop is not available on Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
@@ -0,0 +1,19 @@
+"""
+Importable alias for the FastMCP server in server.modern.py
+
+The dotted file name can't be imported as a module, so ``import server_modern``
+executes server.modern.py under this name instead. The module object is the
+server itself, so ``patch("server_modern.<name>")`` reaches the globals its
+tools use.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    __name__, Path(__file__).with_name("server.modern.py")
+)
+_module = importlib.util.module_from_spec(_spec)
+sys.modules[__name__] = _module
+_spec.loader.exec_module(_module)
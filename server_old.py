@@ -0,0 +1,17 @@
+"""
+Importable alias for the legacy FastAPI server in server.old.py
+
+The dotted file name can't be imported as a module, so process managers that
+take an import string (Gunicorn, multi-worker Uvicorn) use ``server_old:app``.
+"""
+
+import importlib.util
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    "_server_old", Path(__file__).with_name("server.old.py")
+)
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+
+app = _module.app
@@ -1,21 +1,99 @@
 import pytest
-from fastapi.testclient import TestClient
-from main import app
+from unittest.mock import patch
 import json
 import os
+from pathlib import Path
+import httpx
+
+# Canned responses served to server_modern's HTTP client, keyed by URL prefix.
+# Populate through the `http_responses` fixture; exception values are raised.
+HTTP_RESPONSES = {}
+
+
+def _dispatch(request):
+    url = str(request.url)
+    for prefix, response in HTTP_RESPONSES.items():
+        if url.startswith(prefix):
+            if isinstance(response, BaseException):
+                raise response
+            # Fresh copy, so a registered response can be served more than once
+            return httpx.Response(
+                response.status_code, headers=response.headers, content=response.content
+            )
+    raise AssertionError(f"No mocked HTTP response registered for {url}")
+
+
+# Sample PDFs downloaded once into tests/_cache/ and reused across sessions,
+# keyed by cache file name. Add real sample documents here as they are published.
+FIXTURE_PDFS = {}
+
+PDF_CACHE_DIR = Path(__file__).parent / "_cache"
+
+
+def pytest_sessionstart(session):
+    """Fetch any fixture PDF that is not cached yet; cached files are never re-downloaded"""
+    missing = {
+        name: url for name, url in FIXTURE_PDFS.items() if not (PDF_CACHE_DIR / name).exists()
+    }
+    if not missing:
+        return
+    PDF_CACHE_DIR.mkdir(exist_ok=True)
+    with httpx.Client(http2=True, follow_redirects=True, timeout=30.0) as client:
+        for name, url in missing.items():
+            response = client.get(url)
+            response.raise_for_status()
+            (PDF_CACHE_DIR / name).write_bytes(response.content)
+
+
+@pytest.fixture(scope="session")
+def cached_pdf():
+    """Return the bytes of a cached fixture PDF by name"""
+
+    def _read(name):
+        return (PDF_CACHE_DIR / name).read_bytes()
+
+    return _read
+
+
+@pytest.fixture(scope="session")
+def _mock_transport():
+    """Serve server_modern's shared HTTP client from HTTP_RESPONSES for the whole session"""
+    import server_modern
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_dispatch))
+    with patch.object(server_modern, "_HTTP", client):
+        yield server_modern
+
+
+@pytest.fixture
+def http_responses(_mock_transport):
+    """Per-test view of the mocked HTTP registry; cleared after each test"""
+    yield HTTP_RESPONSES
+    HTTP_RESPONSES.clear()
+    # Downloads and parsed models are cached; don't let one test's data leak into the next
+    _mock_transport.clear_caches()
+
 
 @pytest.fixture
 def test_client():
+    """Client for the legacy FastAPI app, imported only by the tests that use it"""
+    from fastapi.testclient import TestClient
+
+    from main_old import app
+
     return TestClient(app)
 
+
 @pytest.fixture
 def sample_le_pdf_url():
     return "https://example.com/sample-le.pdf"
 
+
 @pytest.fixture
 def sample_cd_pdf_url():
     return "https://example.com/sample-cd.pdf"
 
+
 @pytest.fixture
 def mock_mcp_config():
     return {
@@ -25,32 +103,25 @@ def mock_mcp_config():
                 "description": "Parses LE PDF and returns MISMO-compliant JSON with LLM metadata.",
                 "input_schema": {
                     "type": "object",
-                    "properties": {
-                        "pdf_url": {"type": "string"}
-                    },
-                    "required": ["pdf_url"]
+                    "properties": {"pdf_url": {"type": "string"}},
+                    "required": ["pdf_url"],
                 },
-                "output_schema": {
-                    "type": "object"
-                }
+                "output_schema": {"type": "object"},
             },
             {
                 "name": "parse_cd_to_mismo_json",
                 "description": "Parses CD PDF and returns MISMO-compliant JSON with LLM metadata.",
                 "input_schema": {
                     "type": "object",
-                    "properties": {
-                        "pdf_url": {"type": "string"}
-                    },
-                    "required": ["pdf_url"]
+                    "properties": {"pdf_url": {"type": "string"}},
+                    "required": ["pdf_url"],
                 },
-                "output_schema": {
-                    "type": "object"
-                }
-            }
+                "output_schema": {"type": "object"},
+            },
         ]
     }
 
+
 @pytest.fixture
 def mock_mismo_response():
     return {
@@ -59,12 +130,12 @@ def mock_mismo_response():
             "description": "Charges by lender for originating the loan",
             "flags": ["Above typical range for 1% origination cap"],
             "tolerance_bucket": "Limited Increase",
-            "source_location": "Page 2, Section A"
+            "source_location": "Page 2, Section A",
         },
         "APRDelta": 0.31,
         "DeliveryTimeline": {
             "received_by_borrower": "2024-03-01",
             "days_to_close": 12,
-            "compliance_check": "Pass"
-        }
-    } 
\ No newline at end of file
+            "compliance_check": "Pass",
+        },
+    }
@@ -1,5 +1,5 @@
 from fastapi.testclient import TestClient
-from server import app
+from server_old import app
 
 client = TestClient(app)
 
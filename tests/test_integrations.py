@@ -1,6 +1,8 @@
 import pytest
 import json
 from unittest.mock import patch
+# The example toolkits use requests, which the MCP server no longer depends on
+pytest.importorskip("requests")
 from examples.test_integrations import MCPToolkitAutoGen, MCPToolkitLangChain
 
 @pytest.fixture